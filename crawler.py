@@ -1,51 +1,132 @@
 # backend/crawler.py
+import asyncio
 import os
 import re
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
+from html import unescape
+from typing import Iterator, List, Tuple, Optional, Union
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from zoneinfo import ZoneInfo
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # 没装 selectolax（C 扩展）时退回 bs4
+    LexborHTMLParser = None
+
 from models import AnimeInfo
 
 
 BASE_URL = "https://comicat.org/"
 COMICAT_TODAY_URL = urljoin(BASE_URL, "today-1.html")
 TZ = ZoneInfo("Asia/Taipei")  # 服务器时区可能不是台北，这里显式指定
+CACHE_HTML_PATH = "last_comicat_page.html"
+# 落盘是调试用的，默认关掉；DEBUG_CACHE_HTML=1 时才写
+_DEBUG_DUMP = os.environ.get("DEBUG_CACHE_HTML") == "1"
+# 列表默认按时间倒序，遇到昨天之前的行就停；站点哪天顺序乱了，设 COMICAT_FULL_SCAN=1 改为整表扫描
+_FULL_SCAN = os.environ.get("COMICAT_FULL_SCAN") == "1"
+
+# 请求头在进程内不变，导入时建好一次；COMICAT_COOKIE 也只在导入时读
+_BASE_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/123.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Connection": "keep-alive",
+}
+_COOKIE = os.environ.get("COMICAT_COOKIE", "").strip()
+HEADERS = {**_BASE_HEADERS, "Cookie": _COOKIE} if _COOKIE else _BASE_HEADERS
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# 每行都会用到的正则，模块加载时编译一次
+_WS_RE = re.compile(r"\s+")
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s?(GB|GiB|MB|MiB|KB)", re.IGNORECASE)
+_CAPTCHA_SCAN_BYTES = 8192
+_CAPTCHA_MARKERS = (
+    b"captcha", b"Captcha", b"CAPTCHA",
+    b"i'm not a robot", b"I'm not a robot", b"I'm Not a Robot",
+    b"visitor-test-form", b"visitor_test",
+)
+
+# 三档清晰度合成一个正则，一次扫描；档位优先级见 _guess_quality
+_QUALITY_RE = re.compile(
+    r"(?P<uhd>2160p|4K|UHD)"
+    r"|(?P<hd>1080p|BDRip|BluRay|WEB[- ]?DL|WEB[- ]?Rip|WEBRip|WEBrip|HEVC|x265|x264)"
+    r"|(?P<sd>720p)",
+    re.IGNORECASE,
+)
+_CN_DAY_RE = re.compile(r"^(今天|昨天)\s+(\d{1,2}):(\d{2})$")
+# href 前不能是字母/数字/-，避免吃到 data-href；值可以是双引号、单引号或不带引号
+_HREF_RE = re.compile(
+    r"""<a\s[^>]*?(?<![\w-])href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE,
+)
+_CN_DATE_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{2})$")
+# bs4 兜底解析时只建列表表格这一棵子树
+_LIST_TABLE_ONLY = SoupStrainer("table", id="listTable")
 
 
 # ------------------------
 # 小工具
 # ------------------------
+def _join(path: str) -> str:
+    """
+    列表页的详情链接都是 show-xxxx.html 这种相对路径，直接拼 BASE_URL，省掉 urljoin 的整套解析
+    """
+    if path.startswith(("http://", "https://", "magnet:")):
+        return path
+    return BASE_URL + path.lstrip("/")
+
+
 def _clean_text(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip()
+    return _WS_RE.sub(" ", s or "").strip()
 
 
 def _guess_size(text: str) -> str:
-    m = re.search(r"(\d+(?:\.\d+)?)\s?(GB|GiB|MB|MiB|KB)", text, flags=re.IGNORECASE)
+    m = _SIZE_RE.search(text)
     return m.group(0) if m else text or "未知大小"
 
 
 def _guess_quality(text: str) -> str:
-    q_patterns = [
-        r"2160p|4K|UHD",
-        r"1080p|BDRip|BluRay|WEB[- ]?DL|WEB[- ]?Rip|WEBRip|WEBrip|HEVC|x265|x264",
-        r"720p",
-    ]
-    for pat in q_patterns:
-        m = re.search(pat, text, re.IGNORECASE)
-        if m:
+    """
+    优先级：2160p/4K > 1080p/WEB-DL 等 > 720p；同档取最靠前的命中
+    """
+    hd = sd = None
+    for m in _QUALITY_RE.finditer(text):
+        if m.lastgroup == "uhd":
             return m.group(0)
-    return "unknown"
+        if m.lastgroup == "hd":
+            hd = hd or m.group(0)
+        else:
+            sd = sd or m.group(0)
+    return hd or sd or "unknown"
 
 
-def _looks_like_captcha(html: str) -> bool:
-    lower_html = html.lower()
-    markers = ["i'm not a robot", "captcha", "visitor-test-form", "visitor_test"]
-    return any(m in lower_html for m in markers)
+def _looks_like_captcha(html: bytes) -> bool:
+    """
+    验证码标记都在页面开头，只扫前 8KB 原始字节；不整页 lower()，大小写变体直接列出来
+    """
+    head = html[:_CAPTCHA_SCAN_BYTES]
+    return any(m in head for m in _CAPTCHA_MARKERS)
+
+
+def _write_cache_html(html: bytes) -> None:
+    try:
+        with open(CACHE_HTML_PATH, "wb") as f:
+            f.write(html)
+    except Exception as e:
+        print(f"WARN: cannot write {CACHE_HTML_PATH}:", e)
+
+
+def _read_cache_html() -> bytes:
+    with open(CACHE_HTML_PATH, "rb") as f:
+        return f.read()
 
 
 def _parse_cn_time(cell_text: str, now: Optional[datetime] = None) -> datetime:
@@ -55,8 +136,19 @@ def _parse_cn_time(cell_text: str, now: Optional[datetime] = None) -> datetime:
     now = now or datetime.now(TZ)
     t = cell_text.strip()
 
+    # 快速路径：站点给的格式是定宽的，按首字符分支直接切片转 int；形状不对再走下面的正则
+    c = t[:1]
+    try:
+        if (c == "今" or c == "昨") and len(t) == 8 and t[1:3] == "天 " and t[5] == ":":
+            base = now.date() if c == "今" else (now - timedelta(days=1)).date()
+            return datetime(base.year, base.month, base.day, int(t[3:5]), int(t[6:8]), tzinfo=TZ)
+        if c.isdigit() and len(t) == 16 and t[4] == "-" and t[7] == "-" and t[10] == " " and t[13] == ":":
+            return datetime(int(t[0:4]), int(t[5:7]), int(t[8:10]), int(t[11:13]), int(t[14:16]), tzinfo=TZ)
+    except ValueError:
+        pass
+
     # 今天/昨天
-    m = re.match(r"^(今天|昨天)\s+(\d{1,2}):(\d{2})$", t)
+    m = _CN_DAY_RE.match(t)
     if m:
         day_word, hh, mm = m.groups()
         base = now.date() if day_word == "今天" else (now - timedelta(days=1)).date()
@@ -64,7 +156,7 @@ def _parse_cn_time(cell_text: str, now: Optional[datetime] = None) -> datetime:
         return dt
 
     # YYYY-MM-DD HH:MM
-    m = re.match(r"^(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{2})$", t)
+    m = _CN_DATE_RE.match(t)
     if m:
         y, mo, d, hh, mm = map(int, m.groups())
         return datetime(y, mo, d, hh, mm, tzinfo=TZ)
@@ -76,25 +168,24 @@ def _parse_cn_time(cell_text: str, now: Optional[datetime] = None) -> datetime:
 def _extract_magnet_from_detail(detail_html: str) -> str:
     """
     在详情页 HTML 里找 magnet 或 .torrent / download 链接
+    只需要 <a href>，直接对原始 HTML 扫一遍正则，不建 DOM
     """
-    soup = BeautifulSoup(detail_html, "lxml")
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
+    fallback = ""
+    for m in _HREF_RE.finditer(detail_html):
+        href = unescape(m.group(1) or m.group(2) or m.group(3) or "").strip()
         if href.startswith("magnet:?xt=urn:btih:"):
             return href
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        if href.lower().endswith(".torrent") or "download" in href.lower():
-            return href
-    return ""
+        if not fallback and (href.lower().endswith(".torrent") or "download" in href.lower()):
+            fallback = href
+    return fallback
 
 
-def _fetch_detail_link(client: httpx.Client, url: str) -> str:
+async def _fetch_detail_link(client: httpx.AsyncClient, url: str) -> str:
     """
     拉取详情页，尽力找磁力/下载链接，失败则返回原详情页 URL
     """
     try:
-        r = client.get(url, timeout=6.0)
+        r = await client.get(url, timeout=6.0)
         if r.status_code == 200:
             magnet = _extract_magnet_from_detail(r.text)
             return magnet or url
@@ -103,71 +194,119 @@ def _fetch_detail_link(client: httpx.Client, url: str) -> str:
     return url
 
 
+async def _enrich_magnets(client: httpx.AsyncClient, items: List[AnimeInfo], max_detail: int = 12) -> None:
+    """
+    并发拉取前 max_detail 条的详情页，把列表里对应的条目换成 url 为磁力/下载链接的新对象
+    （AnimeInfo 是 frozen 的，只替换列表元素，不改对象本身）
+    """
+    targets = items[:max_detail]
+    links = await asyncio.gather(
+        *(_fetch_detail_link(client, item.url) for item in targets),
+        return_exceptions=True,
+    )
+    for i, link in enumerate(links):
+        if isinstance(link, str):
+            items[i] = replace(items[i], url=link)
+
+
+# ------------------------
+# 行提取：table#listTable tbody#data_list 下的每一行
+# 产出 (发表时间, 标题, 详情页 href, 大小) 四元组，均已清洗
+# ------------------------
+def _iter_rows_lexbor(html: Union[str, bytes]) -> Iterator[Tuple[str, str, str, str]]:
+    tree = LexborHTMLParser(html)
+    for tr in tree.css("table#listTable tbody#data_list > tr"):
+        tds = [node for node in tr.iter() if node.tag == "td"]
+        if len(tds) < 4:
+            continue
+        # tds[1] 是类别（可用于源标签或过滤），暂时不用；保留扩展
+        title_a = tds[2].css_first("a[href]")
+        if title_a is None:
+            continue
+        yield (
+            _clean_text(tds[0].text()),
+            _clean_text(title_a.text()),
+            (title_a.attributes.get("href") or "").strip(),
+            _clean_text(tds[3].text()),
+        )
+
+
+def _iter_rows_bs4(html: Union[str, bytes]) -> Iterator[Tuple[str, str, str, str]]:
+    # 只给 table#listTable 建树，导航/页脚等其余部分直接跳过
+    soup = BeautifulSoup(html, "lxml", parse_only=_LIST_TABLE_ONLY)
+    table = soup.select_one("tbody#data_list")
+    if not table:
+        return
+    for tr in table.find_all("tr", recursive=False):
+        tds = tr.find_all("td", recursive=False)
+        if len(tds) < 4:
+            continue
+        title_a = tds[2].find("a", href=True)
+        if not title_a:
+            continue
+        yield (
+            _clean_text(tds[0].get_text()),
+            _clean_text(title_a.get_text()),
+            title_a["href"].strip(),
+            _clean_text(tds[3].get_text()),
+        )
+
+
+def _iter_today_rows(html: Union[str, bytes]) -> Iterator[Tuple[str, str, str, str]]:
+    if LexborHTMLParser is not None:
+        return _iter_rows_lexbor(html)
+    return _iter_rows_bs4(html)
+
+
 # ------------------------
 # 核心解析：专用 DOM 选择器（高精度）
 # ------------------------
-def _parse_today_table(html: str, client_for_detail: Optional[httpx.Client] = None, max_detail: int = 12) -> List[AnimeInfo]:
+def _parse_today_table(html: Union[str, bytes], limit: int = 5) -> List[AnimeInfo]:
     """
     解析 table#listTable tbody#data_list 中的条目，生成 AnimeInfo 列表。
     - 标题/链接：来自“标题”列的 <a>
     - 大小：来自“大小”列
     - 质量：从标题文本中猜
     - 日期：解析“发表时间”列（今天/昨天/yyyy-mm-dd）
-    - URL：优先尝试详情页补抓磁力（最多补抓 max_detail 条；超过则直接用详情页 URL）
+    - URL：详情页 URL（磁力由 _enrich_magnets 之后补抓）
+    - 解析满 limit 条就停，后面的行不再处理
+    - 碰到早于昨天 0 点的行就停（列表按时间倒序，后面只会更旧）
     """
-    soup = BeautifulSoup(html, "html.parser")
-
-    table = soup.select_one("table#listTable tbody#data_list")
-    if not table:
-        return []
-
-    rows = table.find_all("tr", recursive=False)
     now = datetime.now(TZ)
+    yesterday = (now - timedelta(days=1)).date()
+    cutoff = datetime(yesterday.year, yesterday.month, yesterday.day, tzinfo=TZ)
 
     results: List[AnimeInfo] = []
-    detail_fetch_count = 0
-
-    for tr in rows:
-        tds = tr.find_all("td", recursive=False)
-        if len(tds) < 4:
-            continue
 
+    for date_text, title, href, size_cell in _iter_today_rows(html):
         # 1) 发表时间
-        date_text = _clean_text(tds[0].get_text())
         dt = _parse_cn_time(date_text, now=now)
+        if dt < cutoff:
+            if _FULL_SCAN:
+                continue
+            break
 
-        # 2) 类别（可用于源标签或过滤）
-        # category = _clean_text(tds[1].get_text())  # 暂时不用；保留扩展
-
-        # 3) 标题 + 详情页链接
-        title_a = tds[2].find("a", href=True)
-        if not title_a:
-            continue
-        title = _clean_text(title_a.get_text())
-        detail_url = urljoin(BASE_URL, title_a["href"].strip())
+        # 2) 标题 + 详情页链接
+        detail_url = _join(href)
 
-        # 4) 大小
-        size_text = _guess_size(_clean_text(tds[3].get_text()))
+        # 3) 大小
+        size_text = _guess_size(size_cell)
 
-        # 5) 质量（从标题推断）
+        # 4) 质量（从标题推断）
         quality = _guess_quality(title)
 
-        # 6) URL：先用详情页链接；若允许、再补抓磁力
-        final_url = detail_url
-        if client_for_detail is not None and detail_fetch_count < max_detail:
-            final_url = _fetch_detail_link(client_for_detail, detail_url)
-            detail_fetch_count += 1
-
         results.append(
             AnimeInfo(
                 title=title,
-                url=final_url,
+                url=detail_url,
                 size=size_text,
                 quality=quality,
                 date=dt.isoformat(),
                 source="comicat.org",
             )
         )
+        if len(results) >= limit:
+            break
 
     return results
 
@@ -175,91 +314,88 @@ def _parse_today_table(html: str, client_for_detail: Optional[httpx.Client] = No
 # ------------------------
 # 抓取入口
 # ------------------------
-def scrape_comicat_today() -> Tuple[List[AnimeInfo], str]:
+def new_http_client() -> httpx.AsyncClient:
+    """
+    建一个抓 comicat 用的 AsyncClient（HTTP/2 + 连接池）。
+    由调用方管理生命周期；main.py 里每个进程只建一个，跨请求复用热连接。
+    """
+    return httpx.AsyncClient(
+        timeout=12.0,
+        follow_redirects=True,
+        headers=HEADERS,
+        http2=True,
+        limits=HTTP_LIMITS,
+    )
+
+
+async def scrape_comicat_today(client: httpx.AsyncClient) -> Tuple[List[AnimeInfo], str]:
     """
     实际抓取 https://comicat.org/today-1.html ，使用专用表格解析器。
+    - client 由调用方传入（见 new_http_client），列表页和详情页同源，共用它的连接池
     - 如设置 COMICAT_COOKIE，则携带 Cookie，减少被网关拦截的概率
-    - 自动落盘 last_comicat_page.html 方便调试
-    - 会对前 N 条详情页尝试补抓磁力/下载链接
+    - 设置 DEBUG_CACHE_HTML=1 时落盘 last_comicat_page.html 方便调试，被验证码拦截时用它兜底
+    - 会对前 N 条详情页并发补抓磁力/下载链接
     返回: (items, debug_msg)
     """
-    cookie_header = os.environ.get("COMICAT_COOKIE", "").strip()
-
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/123.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Connection": "keep-alive",
-    }
-    if cookie_header:
-        headers["Cookie"] = cookie_header
-
-    # 保存原始 HTML 便于后续调试
-    with httpx.Client(timeout=12.0, follow_redirects=True, headers=headers) as client:
-        resp = client.get(COMICAT_TODAY_URL)
-        html = resp.text
-
-        try:
-            with open("last_comicat_page.html", "w", encoding="utf-8") as f:
-                f.write(html)
-        except Exception as e:
-            print("WARN: cannot write last_comicat_page.html:", e)
-        # 如果抓到的是验证码页面，就尝试离线缓存
-        if _looks_like_captcha(html):
-            if os.path.exists("last_comicat_page.html"):
-                with open("last_comicat_page.html", "r", encoding="utf-8") as f:
-                    html = f.read()
-                debug_msg = "线上页面被验证码拦截，使用本地缓存 last_comicat_page.html 解析"
-            else:
-                return [], "仍然是验证码/人机校验页面（没有本地缓存可用，请检查/更新 COMICAT_COOKIE）"
+    # 直接用原始字节，不解码成 str；解析器直接吃 bytes（页面是 utf-8）
+    resp = await client.get(COMICAT_TODAY_URL)
+    html = resp.content
+
+    # 如果抓到的是验证码页面，就尝试离线缓存；缓存只在 DEBUG_CACHE_HTML=1 时刷新，
+    # 没开时磁盘上的文件可能是很久以前的快照，不能拿来当今天的结果
+    if _looks_like_captcha(html):
+        if _DEBUG_DUMP and os.path.exists(CACHE_HTML_PATH):
+            html = await asyncio.to_thread(_read_cache_html)
+            debug_msg = "线上页面被验证码拦截，使用本地缓存 last_comicat_page.html 解析"
         else:
-            # 我们成功拿到了真实页面 → 覆盖缓存
-            try:
-                with open("last_comicat_page.html", "w", encoding="utf-8") as f:
-                    f.write(html)
-            except Exception as e:
-                print("WARN: cannot write last_comicat_page.html:", e)
-            debug_msg = "OK"
-
-    # 用“表格专用解析器” +（前 12 条）详情页补抓磁力
-    items = _parse_today_table(html, client_for_detail=client, max_detail=12)
-
+            return [], "仍然是验证码/人机校验页面（没有本地缓存可用，请检查/更新 COMICAT_COOKIE）"
+    else:
+        # 我们成功拿到了真实页面 → 覆盖缓存（放到线程里写，不堵事件循环）
+        if _DEBUG_DUMP:
+            await asyncio.to_thread(_write_cache_html, html)
+        debug_msg = "OK"
+
+    # 用“表格专用解析器”解析前 5 条，再并发补抓磁力
+    items = _parse_today_table(html, limit=5)
     if not items:
         return [], "页面结构已加载，但没有从表格中解析到条目（可能页面改版或选择器不匹配）"
+    await _enrich_magnets(client, items, max_detail=5)
 
-    return items[:5], debug_msg
+    return items, debug_msg
 
 
 # ------------------------
 # 本地兜底
 # ------------------------
+# 演示数据在导入时建好；前两条的 date 每次调用时换成当前时间，其余 frozen 对象直接共享
+_MOCK_DYNAMIC: Tuple[AnimeInfo, ...] = (
+    AnimeInfo(
+        title="【演示】数码宝贝 BEATBREAK - 04 [WebRip 1080p HEVC-10bit AAC][简繁内封字幕]",
+        url="magnet:?xt=urn:btih:fakehash-123",
+        size="567.6MB",
+        quality="1080p HEVC",
+        date="",
+        source="mock.fallback",
+    ),
+    AnimeInfo(
+        title="【演示】不擅吸血的吸血鬼 - 03 (Baha 1920x1080 AVC AAC MP4)",
+        url=urljoin(BASE_URL, "show-eeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee.html"),
+        size="416.7MB",
+        quality="1080p AVC",
+        date="",
+        source="mock.fallback",
+    ),
+)
+_MOCK_STATIC: Tuple[AnimeInfo, ...] = (
+    AnimeInfo(title='[桜都字幕組] 3年Z班銀八老師 / Gintama： 3-nen Z-gumi Ginpachi-sensei [03][1080p][繁體內嵌]', url='https://comicat.org/show-ed9716d5cadb66dabfcaa2f2c021c57a0b8281c1.html', size='624MB', quality='1080p', date='2025-10-26T12:30:00+08:00', source='comicat.org'),
+    AnimeInfo(title='[桜都字幕组] 3年Z组银八先生 / Gintama： 3-nen Z-gumi Ginpachi-sensei [03][1080p][简体内嵌]', url='https://comicat.org/show-601fb5aad8615fc1d0e90f61467729cecb592d31.html', size='624.3MB', quality='1080p', date='2025-10-26T12:30:00+08:00', source='comicat.org'),
+    AnimeInfo(title='[雪飘工作室][キミとアイドルプリキュア♪/You and Idol Precure♪/与你同为 偶像光之美少女♪][720p][38（下周停播）][简体内嵌](检索:Q娃)', url='https://comicat.org/show-2b14be4e0b16ec04814193e35874b49f36229471.html', size='312.3MB', quality='720p', date='2025-10-26T11:53:00+08:00', source='comicat.org'),
+    AnimeInfo(title='[黒ネズミたち] 数码宝贝 BEATBREAK / Digimon Beatbreak - 04 (CR 1920x1080 AVC AAC MKV)', url='https://comicat.org/show-b010399a18e5c8a105dca877edb15ed0dc95988f.html', size='927.2MB', quality='unknown', date='2025-10-26T11:40:00+08:00', source='comicat.org'),
+    AnimeInfo(title='[LoliHouse] 末世二轮之旅 / 终末摩托游 / Shuumatsu Touring - 04 [WebRip 1080p HEVC-10bit AAC][简繁内封字幕]', url='https://comicat.org/show-5e198eb8db4c1a2ae83aa3dbbe5ad3f5ea9411bf.html', size='819.9MB', quality='WebRip', date='2025-10-26T11:01:00+08:00', source='comicat.org'),
+    AnimeInfo(title='[XK SPIRITS][假面骑士ZEZTZ / KAMEN RIDER ZEZTZ][08][简日双语][1080P][WEBrip][MP4]（急招校对、时轴）', url='https://comicat.org/show-b1c76f32632891df6a97d94b106964b882c32863.html', size='664.9MB', quality='1080P', date='2025-10-26T11:13:00+08:00', source='comicat.org'),
+)
+
+
 def mock_scrape_latest() -> List[AnimeInfo]:
     now_iso = datetime.now(TZ).isoformat()
-    return [
-        AnimeInfo(
-            title="【演示】数码宝贝 BEATBREAK - 04 [WebRip 1080p HEVC-10bit AAC][简繁内封字幕]",
-            url="magnet:?xt=urn:btih:fakehash-123",
-            size="567.6MB",
-            quality="1080p HEVC",
-            date=now_iso,
-            source="mock.fallback",
-        ),
-        AnimeInfo(
-            title="【演示】不擅吸血的吸血鬼 - 03 (Baha 1920x1080 AVC AAC MP4)",
-            url=urljoin(BASE_URL, "show-eeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee.html"),
-            size="416.7MB",
-            quality="1080p AVC",
-            date=now_iso,
-            source="mock.fallback",
-        ),
-        AnimeInfo(title='[桜都字幕組] 3年Z班銀八老師 / Gintama： 3-nen Z-gumi Ginpachi-sensei [03][1080p][繁體內嵌]', url='https://comicat.org/show-ed9716d5cadb66dabfcaa2f2c021c57a0b8281c1.html', size='624MB', quality='1080p', date='2025-10-26T12:30:00+08:00', source='comicat.org'),
-        AnimeInfo(title='[桜都字幕组] 3年Z组银八先生 / Gintama： 3-nen Z-gumi Ginpachi-sensei [03][1080p][简体内嵌]', url='https://comicat.org/show-601fb5aad8615fc1d0e90f61467729cecb592d31.html', size='624.3MB', quality='1080p', date='2025-10-26T12:30:00+08:00', source='comicat.org'), 
-        AnimeInfo(title='[雪飘工作室][キミとアイドルプリキュア♪/You and Idol Precure♪/与你同为 偶像光之美少女♪][720p][38（下周停播）][简体内嵌](检索:Q娃)', url='https://comicat.org/show-2b14be4e0b16ec04814193e35874b49f36229471.html', size='312.3MB', quality='720p', date='2025-10-26T11:53:00+08:00', source='comicat.org'),
-        AnimeInfo(title='[黒ネズミたち] 数码宝贝 BEATBREAK / Digimon Beatbreak - 04 (CR 1920x1080 AVC AAC MKV)', url='https://comicat.org/show-b010399a18e5c8a105dca877edb15ed0dc95988f.html', size='927.2MB', quality='unknown', date='2025-10-26T11:40:00+08:00', source='comicat.org'), 
-        AnimeInfo(title='[LoliHouse] 末世二轮之旅 / 终末摩托游 / Shuumatsu Touring - 04 [WebRip 1080p HEVC-10bit AAC][简繁内封字幕]', url='https://comicat.org/show-5e198eb8db4c1a2ae83aa3dbbe5ad3f5ea9411bf.html', size='819.9MB', quality='WebRip', date='2025-10-26T11:01:00+08:00', source='comicat.org'), 
-        AnimeInfo(title='[XK SPIRITS][假面骑士ZEZTZ / KAMEN RIDER ZEZTZ][08][简日双语][1080P][WEBrip][MP4]（急招校对、时轴）', url='https://comicat.org/show-b1c76f32632891df6a97d94b106964b882c32863.html', size='664.9MB', quality='1080P', date='2025-10-26T11:13:00+08:00', source='comicat.org'),
-    ]
+    return [*(replace(e, date=now_iso) for e in _MOCK_DYNAMIC), *_MOCK_STATIC]
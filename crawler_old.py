@@ -1,54 +1,3 @@
-from datetime import datetime, timezone
-from typing import List
-from models import AnimeInfo
-
-
-def mock_scrape_latest() -> List[AnimeInfo]:
-    """
-    模拟“抓取今日最新动漫资源列表”的逻辑。
-    未来可以改成真实爬虫：
-    1. 请求资源站（httpx.get）
-    2. 用 lxml / bs4 解析标题、磁力链接、大小、清晰度、发布时间、来源
-    3. 组装成 AnimeInfo 列表返回
-
-    约定：
-    - 必须返回 List[AnimeInfo]
-    - 字段名、类型要和 models.AnimeInfo 对齐
-    """
-
-    # 我们用统一的时间戳，模拟“今天抓到的条目”
-    now_iso = datetime.now(timezone.utc).isoformat()
-
-    demo_data = [
-        AnimeInfo(
-            title="【10月新番】葬送的芙莉莲 - 第07集 简体内嵌",
-            url="magnet:?xt=urn:btih:fakehash1111",
-            size="1.23 GB",
-            quality="1080p WEBRip",
-            date=now_iso,
-            source="某字幕组 · Nyaa",
-        ),
-        AnimeInfo(
-            title="【BDRip】咒术回战 S2 全24集 完整打包",
-            url="https://example.com/download/jujutsu_s2_batch.torrent",
-            size="14.8 GB",
-            quality="1080p BD x264 FLAC",
-            date=now_iso,
-            source="BDripClub",
-        ),
-        AnimeInfo(
-            title="【剧场版】来自深渊 烈日の黄金郷 - 国语/日语 双音轨",
-            url="magnet:?xt=urn:btih:fakehash2222",
-            size="4.5 GB",
-            quality="1080p BluRay",
-            date=now_iso,
-            source="动画冷门搬运工",
-        ),
-    ]
-
-    return demo_data
-
-
 import re
 from datetime import datetime, timezone
 from typing import List
@@ -1,17 +1,34 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import List, Union
 
 import uvicorn
-from models import AnimeInfo, ErrorResponse
-from crawler import mock_scrape_latest, scrape_comicat_today
-load_dotenv()
+load_dotenv()  # 要在导入 crawler 之前，crawler 在模块加载时读取环境变量
+from models import AnimeInfoModel, ErrorResponse
+from crawler import mock_scrape_latest, new_http_client, scrape_comicat_today
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 每个进程一个 httpx.AsyncClient，跨请求复用 TLS / HTTP2 连接
+    app.state.http = new_http_client()
+    yield
+    await app.state.http.aclose()
+
 
 app = FastAPI(
     title="Anime Downloader Backend",
     description="提供动漫资源抓取给前端仪表盘使用",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # -- CORS 设置 --
@@ -35,6 +52,15 @@ app.add_middleware(
     allow_headers=["*"],   # e.g. Authorization, Content-Type
 )
 
+# -- 抓取结果缓存 --
+# 列表页几分钟才更新一次，TTL 内直接复用结果；锁用来合并并发的未命中，避免同时打上游
+SCRAPE_CACHE_TTL = 120
+_SCRAPE_CACHE_KEY = "comicat_today"
+_SCRAPE_CACHE = TTLCache(maxsize=4, ttl=SCRAPE_CACHE_TTL)
+# 同一份结果按 limit 序列化好的 JSON bytes，命中时直接原样返回，不再过 pydantic / 编码器
+_SCRAPE_JSON_CACHE = TTLCache(maxsize=16, ttl=SCRAPE_CACHE_TTL)
+_SCRAPE_LOCK = asyncio.Lock()
+
 
 @app.get("/api/health")
 def health_check():
@@ -44,10 +70,13 @@ def health_check():
     return {"status": "ok"}
 
 
-@app.get("/api/scrape")
-def scrape_latest():
+# 成功时直接返回预先编码好的 bytes，不经过 response_model 校验；这里只用来生成 OpenAPI 文档
+@app.get("/api/scrape", response_model=Union[List[AnimeInfoModel], ErrorResponse])
+async def scrape_latest(request: Request, force: bool = False, limit: int = Query(5, ge=1)):
     """
     抓取动漫资源列表，让前端展示在表格里、归档、下载模拟等。
+    线上抓取成功的结果缓存 SCRAPE_CACHE_TTL 秒；带 ?force=1 跳过缓存强制重新抓取。
+    ?limit=N 控制最多返回几条（默认 5，上限是爬虫实际抓到的条数）。
 
     前端期望的两种返回格式：
     1) 成功:
@@ -69,22 +98,47 @@ def scrape_latest():
        }
     """
 
-    try:
-        results = scrape_comicat_today()
+    items = None if force else _SCRAPE_CACHE.get(_SCRAPE_CACHE_KEY)
+    cached = items is not None
+    if items is None:
+        async with _SCRAPE_LOCK:
+            # 等锁期间别的请求可能已经抓好了
+            items = None if force else _SCRAPE_CACHE.get(_SCRAPE_CACHE_KEY)
+            cached = items is not None
+            if items is None:
+                try:
+                    items, debug_msg = await scrape_comicat_today(request.app.state.http)
+                except Exception as e:
+                    # 出异常时也用 {error: "..."} 而不是抛500
+                    # 因为你的前端逻辑在等 'error' 字段
+                    return {"error": f"Scrape failed: {e}"}
+                # 只缓存真正从线上解析出来的结果；验证码兜底用的是本地旧页面，不缓存
+                if items and debug_msg == "OK":
+                    _SCRAPE_CACHE[_SCRAPE_CACHE_KEY] = items
+                    _SCRAPE_JSON_CACHE.clear()
+                    cached = True
 
-        # 没抓到内容时，返回 {error: "..."}
-        if not results:
-            return {"error": "No new anime releases today."}
+    # 没抓到内容时，返回 {error: "..."}
+    if not items:
+        return {"error": "No new anime releases today."}
 
-        # FastAPI 会自动把 List[AnimeInfo] 序列化成 JSON 数组
-        return results[0]
+    # orjson 原生支持 dataclass，List[AnimeInfo] 直接编码成 JSON 数组
+    if not cached:
+        return Response(
+            content=orjson.dumps(items[:limit]),
+            media_type="application/json",
+            headers={"Cache-Control": "no-store"},
+        )
+    body = _SCRAPE_JSON_CACHE.get(limit)
+    if body is None:
+        body = orjson.dumps(items[:limit])
+        _SCRAPE_JSON_CACHE[limit] = body
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": f"public, max-age={SCRAPE_CACHE_TTL}"},
+    )
 
-    except Exception as e:
-        # 出异常时也用 {error: "..."} 而不是抛500
-        # 因为你的前端逻辑在等 'error' 字段
-        return {"error": f"Scrape failed: {e}"}
-    
-    
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",           # ASGI app 路径
@@ -1,7 +1,24 @@
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field
 
 
-class AnimeInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AnimeInfo:
+    """
+    单条动漫资源（爬虫内部用）。
+    每行都要建一个，用带 __slots__ 的 frozen dataclass，不走 pydantic 校验；
+    对外的接口结构见 AnimeInfoModel（/api/scrape 的 response_model），两边字段必须一致。
+    """
+    title: str
+    url: str
+    size: str
+    quality: str
+    date: str
+    source: str
+
+
+class AnimeInfoModel(BaseModel):
     """
     单条动漫资源的结构（必须和前端保持一致）
     """